@@ -1,80 +1,713 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import sys
 import os
+import errno
+import hashlib
+import queue
+import socket
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import count
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QPushButton, QLineEdit, QProgressBar, QLabel, 
                            QScrollArea, QFrame, QHBoxLayout, QMessageBox)
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 import requests
-import uuid
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
 
-class DownloadThread(QThread):
+# Seconds a resolved address list is reused before the host is looked up
+# again, and the most hosts kept at once.
+_DNS_TTL = 300
+_DNS_CACHE_SIZE = 256
+
+# (host, port, family, socktype) -> (expiry time, getaddrinfo result)
+_DNS_CACHE: OrderedDict = OrderedDict()
+_DNS_CACHE_LOCK = threading.Lock()
+
+
+def _resolve(host: str, port: int, family: int,
+             socktype: int) -> List[Any]:
+    """
+    Resolve a host name, caching every address for _DNS_TTL seconds.
+
+    Args:
+        host: The host name to resolve
+        port: The port to connect to
+        family: The address family, as passed to getaddrinfo
+        socktype: The socket type, as passed to getaddrinfo
+
+    Returns:
+        The full getaddrinfo result, in the resolver's preferred order
+    """
+    key = (host, port, family, socktype)
+    now = time.monotonic()
+    with _DNS_CACHE_LOCK:
+        entry = _DNS_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            _DNS_CACHE.move_to_end(key)
+            return entry[1]
+    infos = socket.getaddrinfo(host, port, family, socktype)
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = (now + _DNS_TTL, infos)
+        _DNS_CACHE.move_to_end(key)
+        while len(_DNS_CACHE) > _DNS_CACHE_SIZE:
+            _DNS_CACHE.popitem(last=False)
+    return infos
+
+
+def _forget(host: str, port: int, family: int, socktype: int) -> None:
+    """Drop a host's cached addresses so the next connect resolves again."""
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE.pop((host, port, family, socktype), None)
+
+
+class _CachedDNSMixin:
+    """Connection mixin that connects to the cached addresses of its host."""
+
+    def _new_conn(self) -> socket.socket:
+        dns_host = self._dns_host
+        key = (dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        try:
+            infos = _resolve(*key)
+        except OSError:
+            # Let urllib3 resolve again and report the failure itself.
+            return super()._new_conn()
+        # Try every address in order, like urllib3's create_connection,
+        # so one dead address (e.g. a broken IPv6 route) is skipped. Only
+        # the connect target changes; the Host header, SNI and
+        # certificate checks still use the host name.
+        error: Optional[Exception] = None
+        try:
+            for *_, sockaddr in infos:
+                self._dns_host = sockaddr[0]
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError as e:  # Includes NewConnectionError
+                    error = e
+        finally:
+            self._dns_host = dns_host
+        # Every cached address failed; they may be stale.
+        _forget(*key)
+        raise error
+
+
+class _CachedHTTPConnection(_CachedDNSMixin, HTTPConnection):
+    pass
+
+
+class _CachedHTTPSConnection(_CachedDNSMixin, HTTPSConnection):
+    pass
+
+
+class _CachedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedHTTPConnection
+
+
+class _CachedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedHTTPSConnection
+
+
+class _CachingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections resolve host names through _resolve."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CachedHTTPConnectionPool,
+            'https': _CachedHTTPSConnectionPool,
+        }
+
+
+# Shared HTTP session so downloads to the same host reuse pooled
+# keep-alive connections instead of paying a TCP/TLS handshake each time.
+# New connections to an already seen host also skip the DNS lookup.
+_SESSION = requests.Session()
+_ADAPTER = _CachingHTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504))
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+class ChecksumError(Exception):
+    """Raised when a downloaded file does not match its expected SHA-256."""
+
+
+class _Inflater:
+    """
+    Incremental gzip/deflate decoder used by the download writer thread.
+
+    Like urllib3's GzipDecoder it continues into further gzip members and
+    ignores trailing bytes that are not a gzip member. Unlike a bare
+    decompressobj, flush() reports a body that stops before the end of
+    its compressed stream.
+    """
+
+    def __init__(self, encoding: str) -> None:
+        """
+        Initialize the decoder.
+
+        Args:
+            encoding: The Content-Encoding, 'gzip' or 'deflate'
+        """
+        self._encoding: str = encoding
+        wbits = 16 + zlib.MAX_WBITS if encoding == 'gzip' else zlib.MAX_WBITS
+        self._obj = zlib.decompressobj(wbits)
+        self._first: bool = True
+        self._ignore_rest: bool = False
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompress the next piece of the body.
+
+        Args:
+            data: The next compressed bytes
+
+        Returns:
+            The decompressed bytes available so far
+        """
+        if self._ignore_rest:
+            return b''
+        try:
+            out = self._obj.decompress(data)
+        except zlib.error:
+            # 'deflate' should be zlib-wrapped, but some servers send raw
+            # deflate data; fall back to that on the first chunk.
+            if not (self._first and self._encoding == 'deflate'):
+                raise
+            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            out = self._obj.decompress(data)
+        self._first = False
+        if self._encoding != 'gzip':
+            return out
+        parts = [out]
+        while self._obj.eof and self._obj.unused_data:
+            member = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            try:
+                parts.append(member.decompress(self._obj.unused_data))
+            except zlib.error:
+                self._ignore_rest = True  # Trailing garbage.
+                break
+            self._obj = member
+        return b''.join(parts)
+
+    def flush(self) -> bytes:
+        """
+        Finish decoding after the last chunk.
+
+        Returns:
+            Any remaining decompressed bytes
+
+        Raises:
+            zlib.error: If the compressed stream is incomplete
+        """
+        out = self._obj.flush()
+        if not self._obj.eof:
+            raise zlib.error("Compressed body ended before its end of stream")
+        return out
+
+
+class DownloadSignals(QObject):
     """
-    A thread class for handling file downloads.
-    
+    Signals emitted by a DownloadThread.
+
+    QRunnable is not a QObject, so the signals live on this helper. Each
+    DownloadThread has its own instance connected only to its widget, so
+    the signals carry no download ID. Progress is not signalled; see
+    DownloadThread.
+
     Signals:
-        progress_signal: Emits download progress (thread_id, progress_percentage)
-        finished_signal: Emits when download is complete (thread_id)
-        error_signal: Emits when an error occurs (thread_id, error_message)
+        finished_signal: Emits when download is complete
+        error_signal: Emits when an error occurs (error_message)
+    """
+    finished_signal = pyqtSignal()
+    error_signal = pyqtSignal(str)
+
+
+class DownloadThread(QRunnable):
+    """
+    A runnable for handling file downloads on a shared QThreadPool.
+
+    Downloads beyond the pool's thread limit are queued until a worker
+    thread becomes free. Completion and errors are reported through
+    ``signals`` (see DownloadSignals). Progress percentages are written
+    into a dict shared with the main window, keyed by download_id, which
+    the window polls once per frame.
     """
-    progress_signal = pyqtSignal(str, int)
-    finished_signal = pyqtSignal(str)
-    error_signal = pyqtSignal(str, str)
 
-    def __init__(self, url: str, save_path: str) -> None:
+    # Read size per iteration; large enough to amortize per-chunk overhead
+    # while still checking the interrupt flag every 64 KiB.
+    CHUNK: int = 1 << 16
+
+    # Output file buffer; coalesces many chunks into each write() syscall.
+    WRITE_BUFFER: int = 1 << 20
+
+    # Chunks the receiving thread may get ahead of the writer thread
+    # (8 x 64 KiB = 512 KiB), enough to ride out brief disk stalls.
+    QUEUE_CHUNKS: int = 8
+
+    # Files at least this large are fetched as parallel byte ranges when the
+    # server supports it. RANGE_PARTS connections per download keeps a full
+    # pool (8 downloads) within the session's 32 pooled connections. The
+    # pool thread fetches one range itself and RANGE_PARTS - 1 helper
+    # threads fetch the rest, so a download never runs more than
+    # RANGE_PARTS threads (a streamed one runs two: receiver and writer).
+    RANGED_THRESHOLD: int = 16 << 20
+    RANGE_PARTS: int = 4
+
+    # Source of download IDs.
+    _ids = count()
+
+    def __init__(self, url: str, save_path: str, progress: Dict[int, int],
+                 expected_sha256: Optional[str] = None) -> None:
         """
         Initialize the download thread.
 
         Args:
             url: The URL to download from
             save_path: The local path to save the file to
+            progress: Shared download_id -> percentage map read by the UI
+            expected_sha256: Hex SHA-256 the file must match, if any
         """
         super().__init__()
+        # The owning widget keeps this runnable, so the pool must not
+        # delete it when run() returns.
+        self.setAutoDelete(False)
 
         self.url: str = url
         self.save_path: str = save_path
-        self.download_id: str = str(uuid.uuid4())  # Generate a random UUID.
+        self.signals: DownloadSignals = DownloadSignals()
+        self.progress: Dict[int, int] = progress
+        self.download_id: int = next(DownloadThread._ids)
+        self.expected_sha256: Optional[str] = expected_sha256
         self._is_interrupted: bool = False
 
+        # Fed with the file contents as they are written, so verifying
+        # the checksum needs no second pass over the file.
+        self._sha256 = hashlib.sha256() if expected_sha256 else None
+
+        # Progress state, shared by the range workers of a ranged download.
+        self._progress_lock = threading.Lock()
+        self._downloaded: int = 0
+        self._next_report: int = 0  # Byte count of the next percent step
+
     def interrupt(self) -> None:
         """Signal the thread to stop downloading."""
         self._is_interrupted = True
 
     def run(self) -> None:
         """
-        Execute the download process in a separate thread.
-        Handles the actual file download and emits progress signals.
+        Execute the download process on a pool worker thread.
+        Handles the actual file download, publishes progress and emits
+        completion or error signals.
         """
+        fd: Optional[int] = None
+        tmp_path: Optional[str] = None
         try:
-            response = requests.get(self.url, stream=True)
-            response.raise_for_status()
+            total_size, accepts_ranges = self._probe()
+            fd, tmp_path = self._open_output()
+            # Ranges arrive out of order and could only be hashed by reading
+            # the file back, so verified downloads always stream.
+            if (accepts_ranges and total_size >= self.RANGED_THRESHOLD and
+                    self._sha256 is None and hasattr(os, 'pwrite')):
+                self._download_ranged(fd, total_size)
+            else:
+                self._download_stream(fd, total_size)
             
-            total_size = int(response.headers.get('content-length', 0))
+            if not self._is_interrupted:
+                if self._sha256 is not None:
+                    digest = self._sha256.hexdigest()
+                    if digest != self.expected_sha256:
+                        raise ChecksumError(f"SHA-256 mismatch (got {digest})")
+                # _commit_output closes the descriptor, even if it fails.
+                out_fd, fd = fd, None
+                self._commit_output(out_fd, tmp_path)
+                tmp_path = None
+                self.signals.finished_signal.emit()
             
-            with open(self.save_path, 'wb') as f:
+        except Exception as e:
+            self.signals.error_signal.emit(str(e))
+        finally:
+            # A partial or corrupt download never reaches save_path; an
+            # unnamed file disappears on close, a named one is removed.
+            if fd is not None:
+                os.close(fd)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            # Nothing writes the entry after this, so it cannot come back;
+            # the widget shows the final state from the signals.
+            self.progress.pop(self.download_id, None)
+
+    def _temp_path(self) -> str:
+        """Return a hidden temporary path next to save_path."""
+        directory, name = os.path.split(os.path.abspath(self.save_path))
+        return os.path.join(
+            directory, f".{name}.{os.getpid()}-{self.download_id}.part")
+
+    def _open_output(self) -> Tuple[int, Optional[str]]:
+        """
+        Create the file the download is written to.
+
+        On Linux this is an unnamed O_TMPFILE file in the target directory,
+        so nothing is visible until the download completes and nothing is
+        left behind if the process dies. Elsewhere it is a hidden temporary
+        file next to save_path.
+
+        Returns:
+            The file descriptor, and the temporary file's path (None for an
+            unnamed file)
+        """
+        if hasattr(os, 'O_TMPFILE'):
+            directory = os.path.dirname(os.path.abspath(self.save_path))
+            try:
+                return os.open(directory, os.O_RDWR | os.O_TMPFILE, 0o666), None
+            except OSError:
+                pass  # Not supported by this filesystem.
+        tmp_path = self._temp_path()
+        flags = (os.O_RDWR | os.O_CREAT | os.O_EXCL |
+                 getattr(os, 'O_BINARY', 0))
+        return os.open(tmp_path, flags, 0o666), tmp_path
+
+    def _commit_output(self, fd: int, tmp_path: Optional[str]) -> None:
+        """
+        Atomically move the finished file to save_path.
+
+        Closes fd before renaming, since Windows cannot rename a file that
+        is still open. The descriptor is closed even if this fails.
+
+        Args:
+            fd: The output file descriptor
+            tmp_path: The temporary file's path, or None for an unnamed file
+        """
+        unnamed = tmp_path is None
+        try:
+            if unnamed:
+                # Give the unnamed file a temporary name first, so an
+                # existing save_path can be replaced atomically.
+                tmp_path = self._temp_path()
+                directory, name = os.path.split(tmp_path)
+                dir_fd = os.open(directory, os.O_RDONLY)
+                try:
+                    # Passing dir_fd makes os.link use linkat(), which
+                    # follows the /proc symlink to the file; plain link()
+                    # would not.
+                    os.link(f"/proc/self/fd/{fd}", name, dst_dir_fd=dir_fd,
+                            follow_symlinks=True)
+                finally:
+                    os.close(dir_fd)
+        finally:
+            os.close(fd)
+        try:
+            os.replace(tmp_path, self.save_path)
+        except OSError:
+            if unnamed:
+                # run() only knows about named files it created itself.
+                os.remove(tmp_path)
+            raise
+
+    def _probe(self) -> Tuple[int, bool]:
+        """
+        Send a HEAD request to learn the file size and range support.
+
+        Servers that reject HEAD (e.g. 405 or 501) or send an unusable
+        Content-Length are treated as reporting nothing, and the download
+        falls back to learning the size from the GET response.
+
+        Returns:
+            The Content-Length (0 if unknown) and whether the server
+            accepts byte range requests
+        """
+        try:
+            head = _SESSION.head(self.url, allow_redirects=True, timeout=10,
+                                 headers={'Accept-Encoding': 'identity'})
+        except requests.RequestException:
+            return 0, False
+        if not head.ok:
+            return 0, False
+        try:
+            total_size = int(head.headers.get('content-length', 0))
+        except ValueError:
+            return 0, False  # e.g. a repeated "1000, 1000" header
+        accepts_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+        return total_size, accepts_ranges
+
+    def _download_stream(self, fd: int, probed_size: int) -> None:
+        """
+        Download the file over a single streamed GET request.
+
+        Args:
+            fd: The output file descriptor
+            probed_size: The size reported by the HEAD probe (0 if unknown)
+        """
+        with _SESSION.get(self.url, stream=True,
+                          timeout=(5, 30)) as response:
+            # Leaving the block returns the connection to the pool, or
+            # drops it if the body was not read to the end.
+            response.raise_for_status()
+        
+            # The probe asked for the identity encoding, so its size only
+            # describes this body if the GET response is not encoded either.
+            encoded = 'content-encoding' in response.headers
+            total_size = int(response.headers.get('content-length', 0))
+            if total_size == 0 and not encoded:
+                total_size = probed_size
+        
+            with open(fd, 'wb', buffering=self.WRITE_BUFFER, closefd=False) as f:
+                if total_size and not encoded:
+                    self._preallocate(f.fileno(), total_size)
                 if total_size == 0:
                     if not self._is_interrupted:
-                        f.write(response.content)
+                        content = response.content
+                        f.write(content)
+                        if self._sha256 is not None:
+                            self._sha256.update(content)
                 else:
-                    downloaded = 0
-                    for data in response.iter_content(chunk_size=4096):
-                        if self._is_interrupted:
-                            raise InterruptedError("Download interrupted by user")
-                        downloaded += len(data)
-                        f.write(data)
-                        progress = int((downloaded / total_size) * 100)
-                        self.progress_signal.emit(self.download_id, progress)
-            
-            if not self._is_interrupted:
-                self.finished_signal.emit(self.download_id)
+                    raw = response.raw
+                    encoding: Optional[str] = response.headers.get(
+                        'content-encoding', '').lower()
+                    if encoding not in ('gzip', 'deflate'):
+                        encoding = None
+                    # gzip/deflate are inflated by the writer thread; any
+                    # other encoding is decoded inline by urllib3.
+                    raw.decode_content = encoding is None
+                    self._receive(raw, f, total_size, encoding)
+                    # urllib3 1.x does not enforce Content-Length, so a
+                    # connection that closes early just ends the body.
+                    # Encoded bodies are checked by the inflater instead.
+                    if not encoded and self._downloaded != total_size:
+                        raise ConnectionError(
+                            f"Connection closed after {self._downloaded} "
+                            f"of {total_size} bytes")
+                    # Drop any preallocated space the body did not fill.
+                    f.truncate()
+
+    def _receive(self, raw, f, total_size: int,
+                 encoding: Optional[str]) -> None:
+        """
+        Receive the body and hand it to a writer thread.
+
+        This thread only moves bytes off the socket into a small bounded
+        queue; a writer thread inflates (if needed) and writes them. A
+        disk stall or heavy decompression therefore does not stop the
+        socket from being drained until the queue is full.
+
+        Args:
+            raw: The urllib3 response stream
+            f: The output file
+            total_size: The body size from Content-Length
+            encoding: 'gzip' or 'deflate' if the writer must inflate the
+                body, otherwise None
+        """
+        chunks: queue.Queue = queue.Queue(maxsize=self.QUEUE_CHUNKS)
+        errors: List[BaseException] = []
+        writer = threading.Thread(target=self._write_chunks,
+                                  args=(chunks, f, encoding, self._sha256,
+                                        errors))
+        writer.start()
+        try:
+            while not errors:
+                if self._is_interrupted:
+                    raise InterruptedError("Download interrupted by user")
+                # Queue the bytes object read() returns as is. urllib3's
+                # readinto() is itself a read() plus a copy, and with
+                # decode_content it can return more than asked for, which
+                # a fixed buffer cannot take.
+                chunk = raw.read(self.CHUNK)
+                if not chunk:
+                    break
+                chunks.put(chunk)
+                self._add_progress(len(chunk), total_size)
+        finally:
+            chunks.put(None)
+            writer.join()
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _write_chunks(chunks: queue.Queue, f, encoding: Optional[str],
+                      sha256, errors: List[BaseException]) -> None:
+        """
+        Write queued chunks to the output file, inflating them if needed.
+
+        A compressed body that ends early is reported through errors, so it
+        is not mistaken for a complete download.
+
+        Runs until it receives None. After a failure it keeps draining the
+        queue so the receiving thread never blocks on a full queue.
+
+        Args:
+            chunks: The queue of received chunks, ended by None
+            f: The output file
+            encoding: 'gzip' or 'deflate' to inflate the chunks, or None
+            sha256: Hash object to feed the written data to, or None
+            errors: Receives the exception if decompression or writing fails
+        """
+        inflater = _Inflater(encoding) if encoding is not None else None
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                break
+            if errors:
+                continue
+            try:
+                if inflater is not None:
+                    chunk = inflater.decompress(chunk)
+                f.write(chunk)
+                if sha256 is not None:
+                    sha256.update(chunk)
+            except Exception as e:
+                errors.append(e)
+        if inflater is not None and not errors:
+            try:
+                data = inflater.flush()
+                f.write(data)
+                if sha256 is not None:
+                    sha256.update(data)
+            except Exception as e:
+                errors.append(e)
+
+    def _download_ranged(self, fd: int, total_size: int) -> None:
+        """
+        Download the file as RANGE_PARTS concurrent byte range requests.
+
+        The first range is fetched on the current thread and the others on
+        RANGE_PARTS - 1 helper threads. Each range is written at its own
+        offset with os.pwrite, so they share one file descriptor without
+        seeking.
+
+        Args:
+            fd: The output file descriptor
+            total_size: The file size reported by the server
+        """
+        self._preallocate(fd, total_size)
+        part_size = -(-total_size // self.RANGE_PARTS)
+        ranges = [(start, min(start + part_size, total_size) - 1)
+                  for start in range(0, total_size, part_size)]
+        abort = threading.Event()
+        (first_start, first_end), rest = ranges[0], ranges[1:]
+        with ThreadPoolExecutor(max_workers=max(1, len(rest))) as executor:
+            futures = [executor.submit(self._fetch_range, fd, start, end,
+                                       total_size, abort)
+                       for start, end in rest]
+            try:
+                self._fetch_range(fd, first_start, first_end, total_size,
+                                  abort)
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Stop the remaining ranges before the executor joins.
+                abort.set()
+                raise
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        """
+        Reserve disk space for the whole file before writing it.
+
+        Allocating up front lets the filesystem lay the file out
+        contiguously, and a full disk fails before anything is downloaded.
+        Uses posix_fallocate where available and otherwise just extends
+        the file.
+
+        Args:
+            fd: The output file descriptor
+            size: The final file size in bytes
+        """
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                return
+            except OSError as e:
+                # Only fall back if the filesystem cannot preallocate;
+                # ENOSPC and other errors are real failures.
+                if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):
+                    raise
+        os.ftruncate(fd, size)
+
+    def _fetch_range(self, fd: int, start: int, end: int, total_size: int,
+                     abort: threading.Event) -> None:
+        """
+        Download one byte range and write it into the output file.
+
+        Args:
+            fd: The output file descriptor
+            start: The first byte of the range
+            end: The last byte of the range (inclusive)
+            total_size: The size of the whole file, for progress
+            abort: Set when a range failed and the others should stop; this
+                range sets it itself if it fails
+        """
+        try:
+            headers = {'Range': f'bytes={start}-{end}',
+                       'Accept-Encoding': 'identity'}
+            with _SESSION.get(self.url, headers=headers, stream=True,
+                              timeout=(5, 30)) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise ValueError("Server ignored the byte range request")
             
-        except InterruptedError as e:
-            self.error_signal.emit(self.download_id, str(e))
-            # Clean up partial download
-            if os.path.exists(self.save_path):
-                os.remove(self.save_path)
-        except Exception as e:
-            self.error_signal.emit(self.download_id, str(e))
+                # Receive CHUNK-sized reads into a WRITE_BUFFER-sized buffer
+                # and pwrite it once full, so each syscall writes many
+                # chunks.
+                raw = response.raw
+                buf = bytearray(self.WRITE_BUFFER)
+                mv = memoryview(buf)
+                offset = start  # File offset of buf[0]
+                filled = 0
+                while offset + filled <= end:
+                    if self._is_interrupted:
+                        raise InterruptedError("Download interrupted by user")
+                    if abort.is_set():
+                        return
+                    want = min(self.CHUNK, self.WRITE_BUFFER - filled,
+                               end + 1 - offset - filled)
+                    n = raw.readinto(mv[filled:filled + want])
+                    if not n:
+                        raise ConnectionError(
+                            f"Connection closed before byte range "
+                            f"{start}-{end} was complete")
+                    filled += n
+                    self._add_progress(n, total_size)
+                    if filled == self.WRITE_BUFFER or offset + filled > end:
+                        os.pwrite(fd, mv[:filled], offset)
+                        offset += filled
+                        filled = 0
+        except BaseException:
+            # Stop the other ranges, including the one on the pool thread,
+            # which only checks abort and never sees this future.
+            abort.set()
+            raise
+
+    def _add_progress(self, n: int, total_size: int) -> None:
+        """
+        Record newly received bytes and publish the new percentage.
+
+        Single dict item assignment is atomic under the GIL, so the UI
+        thread can read the map without further locking. The percentage
+        is only computed once the byte count reaches the next whole
+        percent, so most chunks cost a single integer comparison.
+
+        Args:
+            n: The number of bytes just received
+            total_size: The size of the whole file
+        """
+        with self._progress_lock:
+            self._downloaded += n
+            if self._downloaded >= self._next_report:
+                pct = self._downloaded * 100 // total_size
+                self.progress[self.download_id] = pct
+                # Smallest byte count whose percentage is pct + 1.
+                self._next_report = -(-(pct + 1) * total_size // 100)
 
 class DownloadWidget(QFrame):
     """
@@ -82,17 +715,25 @@ class DownloadWidget(QFrame):
     Displays the URL, progress bar, and status of the download.
     """
 
-    def __init__(self, url: str, save_path: str) -> None:
+    def __init__(self, url: str, save_path: str, pool: QThreadPool,
+                 progress: Dict[int, int],
+                 expected_sha256: Optional[str] = None) -> None:
         """
         Initialize the download widget.
 
         Args:
             url: The URL to download from
             save_path: The local path to save the file to
+            pool: The thread pool the download is run on
+            progress: Shared download_id -> percentage map for the thread
+            expected_sha256: Hex SHA-256 the file must match, if any
         """
         super().__init__()
         self.url: str = url
         self.save_path: str = save_path
+        self.expected_sha256: Optional[str] = expected_sha256
+        self.pool: QThreadPool = pool
+        self.progress: Dict[int, int] = progress
         self.thread: Optional[DownloadThread] = None
         self.is_started: bool = False
         self.is_finished: bool = False
@@ -130,17 +771,17 @@ class DownloadWidget(QFrame):
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
 
     def _setup_thread(self) -> None:
-        """Initialize the download thread and connect signals."""
-        self.thread = DownloadThread(self.url, self.save_path)
-        self.thread.progress_signal.connect(self.update_progress)
-        self.thread.finished_signal.connect(self.download_finished)
-        self.thread.error_signal.connect(self.download_error)
+        """Initialize the download runnable and connect signals."""
+        self.thread = DownloadThread(self.url, self.save_path, self.progress,
+                                     self.expected_sha256)
+        self.thread.signals.finished_signal.connect(self.download_finished)
+        self.thread.signals.error_signal.connect(self.download_error)
         self.download_id = self.thread.download_id
 
     def start_download(self) -> None:
-        """Start the download if it hasn't been started yet."""
+        """Queue the download on the pool if it hasn't been started yet."""
         if not self.is_started and self.thread:
-            self.thread.start()
+            self.pool.start(self.thread)
             self.status_label.setText("Downloading...")
             self.is_started = True
             self.interrupt_button.setEnabled(True)
@@ -150,43 +791,40 @@ class DownloadWidget(QFrame):
         if self.thread and self.is_started and not self.is_finished:
             self.thread.interrupt()
             self.interrupt_button.setEnabled(False)
-            self.status_label.setText("Interrupting...")
+            if self.pool.tryTake(self.thread):
+                # Still waiting in the pool queue; it will never run.
+                self.status_label.setText("Error: Download interrupted by user")
+            else:
+                self.status_label.setText("Interrupting...")
 
-    def update_progress(self, thread_id: str, progress: int) -> None:
+    def update_progress(self, progress: int) -> None:
         """
         Update the progress bar value.
 
         Args:
-            thread_id: The ID of the download thread
             progress: The download progress percentage
         """
-        if thread_id == self.download_id:
-            self.progress_bar.setValue(progress)
+        self.progress_bar.setValue(progress)
 
-    def download_finished(self, thread_id: str) -> None:
-        """
-        Handle download completion.
-
-        Args:
-            thread_id: The ID of the download thread
-        """
-        if thread_id == self.download_id:
+    def download_finished(self) -> None:
+        """Handle download completion."""
+        if self.expected_sha256:
+            self.status_label.setText("Complete! (SHA-256 verified)")
+        else:
             self.status_label.setText("Complete!")
-            self.progress_bar.setValue(100)
-            self.is_finished = True
-            self.interrupt_button.setEnabled(False)
+        self.progress_bar.setValue(100)
+        self.is_finished = True
+        self.interrupt_button.setEnabled(False)
 
-    def download_error(self, thread_id: str, error_msg: str) -> None:
+    def download_error(self, error_msg: str) -> None:
         """
         Handle download errors.
 
         Args:
-            thread_id: The ID of the download thread
             error_msg: The error message to display
         """
-        if thread_id == self.download_id:
-            self.status_label.setText(f"Error: {error_msg}")
-            self.interrupt_button.setEnabled(False)
+        self.status_label.setText(f"Error: {error_msg}")
+        self.interrupt_button.setEnabled(False)
 
 
 class DownloaderApp(QMainWindow):
@@ -200,13 +838,30 @@ class DownloaderApp(QMainWindow):
         super().__init__()        
         
         self.downloads: List[DownloadWidget] = []
+
+        # Bounded pool; downloads beyond the limit wait in its queue.
+        # Idle workers never expire, so later batches reuse the same OS
+        # threads instead of creating new ones.
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(min(8, (os.cpu_count() or 1) * 2))
+        self.pool.setExpiryTimeout(-1)
+
+        # Download threads write their percentage here; one timer tick per
+        # frame repaints every progress bar instead of one signal per update.
+        self._progress: Dict[int, int] = {}
+        # The timer only runs while downloads are active.
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self._setup_ui()    
 
     def _setup_ui(self) -> None:
         """Set up the main UI components."""
         
         self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText("Enter URL to download")
+        self.url_input.setPlaceholderText(
+            "Enter URL to download, optionally followed by its SHA-256")
         
         add_button = QPushButton("Add Download")
         add_button.setFixedWidth(90)
@@ -267,10 +922,19 @@ class DownloaderApp(QMainWindow):
         """
         Add a new download to the list without starting it.
         Creates a new DownloadWidget and adds it to the 
-        scroll area.
+        scroll area. The URL may be followed by a hex SHA-256 digest
+        that the downloaded file is verified against.
         """
-        url = self.url_input.text().strip()
-        if not url:
+        fields = self.url_input.text().split()
+        if not fields:
+            return
+        url = fields[0]
+        expected_sha256 = fields[1].lower() if len(fields) > 1 else None
+        if expected_sha256 is not None and (
+                len(expected_sha256) != 64 or
+                not all(c in '0123456789abcdef' for c in expected_sha256)):
+            QMessageBox.warning(self, 'Invalid Checksum',
+                                'The SHA-256 must be 64 hexadecimal digits.')
             return
         
         filename = os.path.basename(url.split('?')[0])
@@ -279,18 +943,33 @@ class DownloaderApp(QMainWindow):
             
         save_path = filename
         
-        download_widget = DownloadWidget(url, save_path)
+        download_widget = DownloadWidget(url, save_path, self.pool,
+                                         self._progress, expected_sha256)
         self.downloads_layout.insertWidget(len(self.downloads), 
                                            download_widget)
         self.downloads.append(download_widget)
         
         self.url_input.clear()
 
+    def _flush_progress(self) -> None:
+        """
+        Copy the latest published progress into each progress bar.
+        Stops the timer once the pool has no download left to run.
+        """
+        for download in self.downloads:
+            progress = self._progress.get(download.download_id)
+            if progress is not None:
+                download.update_progress(progress)
+        if self.pool.activeThreadCount() == 0:
+            self._progress_timer.stop()
+
     def start_all_downloads(self) -> None:
         """Start all downloads that haven't been started yet."""
         for download in self.downloads:
             if not download.is_started:
                 download.start_download()
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
 
     def interrupt_all_downloads(self) -> None:
         """Interrupt all active downloads."""
@@ -0,0 +1,75 @@
+import gzip
+import importlib.util
+import io
+import os
+import queue
+import zlib
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("requests")
+
+_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                     "concurrent-file-downloader.py")
+_spec = importlib.util.spec_from_file_location("downloader", _PATH)
+downloader = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(downloader)
+
+
+def write_chunks(body, encoding, chunk_size=1000):
+    """Run the writer thread body over body split into chunks."""
+    chunks = queue.Queue()
+    for i in range(0, len(body), chunk_size):
+        chunks.put(body[i:i + chunk_size])
+    chunks.put(None)
+    f = io.BytesIO()
+    errors = []
+    downloader.DownloadThread._write_chunks(chunks, f, encoding, None, errors)
+    return f.getvalue(), errors
+
+
+def test_gzip_multiple_members():
+    a = os.urandom(50000) * 2
+    b = b"b" * 100000
+    data, errors = write_chunks(gzip.compress(a) + gzip.compress(b), "gzip")
+    assert errors == []
+    assert data == a + b
+
+
+def test_gzip_member_boundary_on_chunk_boundary():
+    first = gzip.compress(b"a" * 5000)
+    body = first + gzip.compress(b"b" * 5000)
+    data, errors = write_chunks(body, "gzip", chunk_size=len(first))
+    assert errors == []
+    assert data == b"a" * 5000 + b"b" * 5000
+
+
+def test_gzip_trailing_garbage_is_ignored():
+    data, errors = write_chunks(gzip.compress(b"x" * 1000) + b"\0" * 16,
+                                "gzip")
+    assert errors == []
+    assert data == b"x" * 1000
+
+
+@pytest.mark.parametrize("encoding, compress", [
+    ("gzip", gzip.compress),
+    ("deflate", zlib.compress),
+])
+def test_truncated_body_is_an_error(encoding, compress):
+    body = compress(os.urandom(20000))
+    _, errors = write_chunks(body[:len(body) // 2], encoding)
+    assert len(errors) == 1
+    assert isinstance(errors[0], zlib.error)
+
+
+def test_raw_deflate():
+    data, errors = write_chunks(zlib.compress(b"y" * 10000)[2:-4], "deflate")
+    assert errors == []
+    assert data == b"y" * 10000
+
+
+def test_identity_passthrough():
+    data, errors = write_chunks(b"plain" * 1000, None)
+    assert errors == []
+    assert data == b"plain" * 1000